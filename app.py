@@ -1,19 +1,10 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import random
-from faker import Faker
 
-# Initialize faker for dummy data
-fake = Faker()  # <-- This needs to come BEFORE any fake.xxx() calls
-
-# Initialize data at the module level (top of app.py)
-@st.cache_resource
-def load_data():
-    return generate_dummy_data()
+# Plotly and Faker are imported inside the functions that use them to keep cold start fast
 
 # Set page config
 st.set_page_config(
@@ -24,76 +15,119 @@ st.set_page_config(
 )
 
 # Generate dummy data for multiple department managers
+# Cached so the data is only generated once, not on every rerun
+@st.cache_data(ttl=None, show_spinner=False)
 def generate_dummy_data():
+    # Initialize faker for dummy data, only needed the first time data is generated
+    from faker import Faker
+    fake = Faker()
+    
     departments = ['Engineering', 'Marketing', 'Sales', 'HR', 'Finance', 'Product']
     roles = ['Manager', 'Senior', 'Mid-level', 'Junior']
     
-    employees = []
-    for i in range(50):
-        dept = random.choice(departments)
-        role = random.choice(roles)
-        employees.append({
-            'id': i+1,
-            'name': fake.name(),
-            'department': dept,
-            'role': role,
-            'email': fake.email(),
-            'join_date': fake.date_between(start_date='-5y', end_date='today'),
-            'manager': random.choice([True, False]) if role == 'Manager' else False
-        })
+    num_employees = 50
+    num_days = 30
+    emp_ids = np.arange(1, num_employees + 1)
+    
+    dept_arr = np.random.choice(departments, num_employees)
+    role_arr = np.random.choice(roles, num_employees)
+    employees = pd.DataFrame({
+        'id': emp_ids,
+        'name': [fake.name() for _ in range(num_employees)],
+        'department': pd.Categorical(dept_arr, categories=departments),
+        'role': pd.Categorical(role_arr, categories=roles),
+        'email': [fake.email() for _ in range(num_employees)],
+        'join_date': [fake.date_between(start_date='-5y', end_date='today') for _ in range(num_employees)],
+        'manager': (role_arr == 'Manager') & (np.random.random(num_employees) < 0.5)
+    })
     
     # Create check-in data for last 30 days
-    check_in_data = []
-    for emp in employees:
-        # Ensure each employee has at least 5 check-ins
-        for days_ago in range(5, 35):  # Last 30 days but skip first 5 to ensure recency
-            date = datetime.now() - timedelta(days=days_ago)
-            check_in_data.append({
-                'employee_id': emp['id'],
-                'date': date.date(),
-                'stress': random.randint(1, 10),
-                'energy': random.randint(1, 10),
-                'motivation': random.randint(1, 10),
-                'work_enjoyment': random.randint(1, 10),
-                'notes': random.choice(["", fake.sentence(), ""])
-            })
+    # Skip the most recent 5 days to ensure recency, one row per employee per day
+    today = pd.Timestamp.today().normalize()
+    days = today - pd.to_timedelta(np.arange(5, 5 + num_days), unit='D')
+    num_check_ins = num_employees * num_days
+    # About a third of check-ins have a note, drawn from a small pre-generated pool
+    sentence_pool = [fake.sentence() for _ in range(20)]
+    notes = np.where(np.random.random(num_check_ins) < 1/3,
+                     np.random.choice(sentence_pool, num_check_ins), "")
+    check_ins = pd.DataFrame({
+        'employee_id': np.repeat(emp_ids, num_days),
+        'date': np.tile(days.to_numpy(), num_employees),
+        'stress': np.random.randint(1, 11, num_check_ins),
+        'energy': np.random.randint(1, 11, num_check_ins),
+        'motivation': np.random.randint(1, 11, num_check_ins),
+        'work_enjoyment': np.random.randint(1, 11, num_check_ins),
+        'notes': notes
+    })
+    # Calendar keys used for grouping on the dashboard
+    check_ins['month'] = check_ins['date'].dt.month.astype('int8')
+    check_ins['iso_week'] = check_ins['date'].dt.isocalendar().week.astype('int8')
+    # Scores are 1-10, so int8 is wide enough
+    check_ins = check_ins.astype({'stress': 'int8', 'energy': 'int8', 'motivation': 'int8', 'work_enjoyment': 'int8'})
     
     # Create performance data
-    performance_data = []
-    for emp in employees:
-        for month in range(1, 13):
-            performance_data.append({
-                'employee_id': emp['id'],
-                'month': month,
-                'kpi': random.randint(60, 100),
-                'projects_completed': random.randint(1, 5),
-                'feedback_score': random.randint(3, 5),
-                'overtime_hours': random.randint(0, 30)
-            })
-    
-    # Return all data as a dictionary
+    num_months = 12
+    num_reviews = num_employees * num_months
+    performance = pd.DataFrame({
+        'employee_id': np.repeat(emp_ids, num_months),
+        'month': np.tile(np.arange(1, num_months + 1), num_employees),
+        'kpi': np.random.randint(60, 101, num_reviews),
+        'projects_completed': np.random.randint(1, 6, num_reviews),
+        'feedback_score': np.random.randint(3, 6, num_reviews),
+        'overtime_hours': np.random.randint(0, 31, num_reviews)
+    })
+    performance = performance.astype({
+        'month': 'int8',
+        'kpi': 'int16',
+        'projects_completed': 'int8',
+        'feedback_score': 'int8',
+        'overtime_hours': 'int8'
+    })
+    
+    # Return all data as a dictionary, with the per-employee tables indexed
+    # by employee_id so lookups are a sorted index search instead of a full scan
     return {
-        'employees': pd.DataFrame(employees),
-        'check_ins': pd.DataFrame(check_in_data),
-        'performance': pd.DataFrame(performance_data)
+        'version': datetime.now().isoformat(),
+        'employees': employees,
+        'check_ins': check_ins.set_index('employee_id').sort_index(),
+        'performance': performance.set_index('employee_id').sort_index()
     }
 
 # Load data once when the app starts
-data = load_data()
+data = generate_dummy_data()
 employees_df = data['employees']
 check_ins_df = data['check_ins']
 performance_df = data['performance']
+data_version = data['version']
+
+# Burnout thresholds on weekly averages: stress above or energy below
+HIGH_BURNOUT_STRESS, HIGH_BURNOUT_ENERGY = 7, 4
+MODERATE_BURNOUT_STRESS, MODERATE_BURNOUT_ENERGY = 5, 5
+
+# Classify burnout risk from weekly stress/energy averages, one row per employee
+# Works on plain NumPy arrays and integer codes, so no strings are built or re-hashed
+def classify_burnout(weekly_df):
+    stress = weekly_df['stress'].to_numpy()
+    energy = weekly_df['energy'].to_numpy()
+    conds = [
+        (stress > HIGH_BURNOUT_STRESS) | (energy < HIGH_BURNOUT_ENERGY),
+        (stress > MODERATE_BURNOUT_STRESS) | (energy < MODERATE_BURNOUT_ENERGY)
+    ]
+    codes = np.select(conds, [2, 1], default=0).astype('int8')
+    return pd.Categorical.from_codes(codes, categories=['Low', 'Moderate', 'High'], ordered=True)
 
 # Calculate derived metrics
-def calculate_metrics(employee_id=None, department=None):
+# Pass emp_ids along with department when the caller already has them
+def calculate_metrics(employee_id=None, department=None, emp_ids=None):
     # Get relevant check-ins
     if employee_id:
-        emp_check_ins = check_ins_df[check_ins_df['employee_id'] == employee_id]
-        emp_performance = performance_df[performance_df['employee_id'] == employee_id]
-    elif department:
-        emp_ids = employees_df[employees_df['department'] == department]['id'].tolist()
-        emp_check_ins = check_ins_df[check_ins_df['employee_id'].isin(emp_ids)]
-        emp_performance = performance_df[performance_df['employee_id'].isin(emp_ids)]
+        emp_check_ins = check_ins_df.loc[employee_id:employee_id]
+        emp_performance = performance_df.loc[employee_id:employee_id]
+    elif department or emp_ids is not None:
+        if emp_ids is None:
+            emp_ids = employees_df.loc[employees_df['department'] == department, 'id'].to_numpy()
+        emp_check_ins = check_ins_df.loc[emp_ids]
+        emp_performance = performance_df.loc[emp_ids]
     else:
         emp_check_ins = check_ins_df
         emp_performance = performance_df
@@ -105,7 +139,7 @@ def calculate_metrics(employee_id=None, department=None):
             'monthly_avg': {'stress': 5, 'energy': 5, 'motivation': 5, 'work_enjoyment': 5},
             'burnout_risk': "Low",
             'avg_kpi': 75,
-            'latest_date': datetime.now().date()
+            'latest_date': pd.Timestamp.today().normalize()
         }
     
     # Calculate weekly/monthly averages
@@ -116,26 +150,17 @@ def calculate_metrics(employee_id=None, department=None):
     weekly_check_ins = emp_check_ins[emp_check_ins['date'] >= week_ago]
     monthly_check_ins = emp_check_ins[emp_check_ins['date'] >= month_ago]
     
-    # Calculate averages with fallback values
-    weekly_avg = {
-        'stress': weekly_check_ins['stress'].mean() if not weekly_check_ins.empty else 5,
-        'energy': weekly_check_ins['energy'].mean() if not weekly_check_ins.empty else 5,
-        'motivation': weekly_check_ins['motivation'].mean() if not weekly_check_ins.empty else 5,
-        'work_enjoyment': weekly_check_ins['work_enjoyment'].mean() if not weekly_check_ins.empty else 5
-    }
-    
-    monthly_avg = {
-        'stress': monthly_check_ins['stress'].mean() if not monthly_check_ins.empty else 5,
-        'energy': monthly_check_ins['energy'].mean() if not monthly_check_ins.empty else 5,
-        'motivation': monthly_check_ins['motivation'].mean() if not monthly_check_ins.empty else 5,
-        'work_enjoyment': monthly_check_ins['work_enjoyment'].mean() if not monthly_check_ins.empty else 5
-    }
+    # Calculate averages with fallback values, one aggregation per window
+    mood_cols = ['stress', 'energy', 'motivation', 'work_enjoyment']
+    fallback_avg = dict.fromkeys(mood_cols, 5)
+    weekly_avg = weekly_check_ins[mood_cols].mean().to_dict() if not weekly_check_ins.empty else fallback_avg
+    monthly_avg = monthly_check_ins[mood_cols].mean().to_dict() if not monthly_check_ins.empty else fallback_avg
     
     # Calculate burnout risk
     burnout_risk = "Low"
-    if weekly_avg['stress'] > 7 or weekly_avg['energy'] < 4:
+    if weekly_avg['stress'] > HIGH_BURNOUT_STRESS or weekly_avg['energy'] < HIGH_BURNOUT_ENERGY:
         burnout_risk = "High"
-    elif weekly_avg['stress'] > 5 or weekly_avg['energy'] < 5:
+    elif weekly_avg['stress'] > MODERATE_BURNOUT_STRESS or weekly_avg['energy'] < MODERATE_BURNOUT_ENERGY:
         burnout_risk = "Moderate"
     
     # Performance metrics
@@ -149,8 +174,85 @@ def calculate_metrics(employee_id=None, department=None):
         'latest_date': latest_date
     }
 
+# Calculate per-employee metrics for every employee in one pass
+# The DataFrames are skipped by Streamlit's hasher (leading underscore), so the
+# cache is keyed only on data_version, which changes when the data is regenerated
+@st.cache_data(show_spinner=False)
+def compute_all_metrics(_check_ins, _performance, data_version):
+    mood_cols = ['stress', 'energy', 'motivation', 'work_enjoyment']
+    
+    # Weekly window is relative to each employee's latest check-in
+    latest_date = _check_ins.groupby(level='employee_id')['date'].max()
+    week_ago = (latest_date - timedelta(days=7)).loc[_check_ins.index]
+    weekly_check_ins = _check_ins[_check_ins['date'].to_numpy() >= week_ago.to_numpy()]
+    
+    metrics = weekly_check_ins.groupby(level='employee_id')[mood_cols].mean()
+    metrics['burnout_risk'] = classify_burnout(metrics)
+    metrics['avg_kpi'] = _performance.groupby(level='employee_id')['kpi'].mean()
+    metrics['latest_date'] = latest_date
+    return metrics
+
+# Look up precomputed metrics for a set of employees, with fallbacks for missing check-ins
+def lookup_metrics(all_metrics, emp_ids):
+    return all_metrics.reindex(emp_ids).fillna({
+        'burnout_risk': "Low",
+        'avg_kpi': 75,
+        'latest_date': pd.Timestamp.today().normalize()
+    })
+
+# Emoji indicator for a burnout risk categorical, shown as plain text instead of cell styling
+# Indexed by category code, in the Low/Moderate/High order classify_burnout uses
+def burnout_icons(risk):
+    return np.array(['🟢', '🟡', '🔴'])[risk.codes]
+
+# Build the manager view's team summary table for one department
+# Cached per department and data version so unrelated widgets don't rebuild it;
+# like compute_all_metrics, the underscore-prefixed frames are not hashed
+@st.cache_data(show_spinner=False)
+def build_team_df(_employees, _check_ins, _performance, dept, data_version):
+    # Look up precomputed metrics for each team member
+    team_members = _employees[_employees['department'] == dept]
+    team_metrics = lookup_metrics(compute_all_metrics(_check_ins, _performance, data_version), team_members['id'])
+    
+    return pd.DataFrame({
+        'Name': team_members['name'].to_numpy(),
+        'Role': team_members['role'].to_numpy(),
+        'Risk': burnout_icons(team_metrics['burnout_risk'].array),
+        'Burnout Risk': team_metrics['burnout_risk'].array,
+        'Performance': team_metrics['avg_kpi'].to_numpy(),
+        'Last Check-in': team_metrics['latest_date'].to_numpy(),
+        'ID': team_members['id'].to_numpy()
+    })
+
+# Aggregate an employee's monthly mood and KPI for the performance vs mood chart
+# Cached per employee and data version; returns None without enough data
+@st.cache_data(show_spinner=False)
+def build_mood_perf_data(_check_ins, _performance, employee_id, data_version):
+    emp_check_ins = _check_ins.loc[employee_id:employee_id]
+    emp_performance = _performance.loc[employee_id:employee_id]
+    
+    if emp_check_ins.empty or emp_performance.empty:
+        return None
+    
+    monthly_mood = emp_check_ins.groupby('month')[['stress', 'energy', 'motivation', 'work_enjoyment']].mean().reset_index()
+    return pd.merge(monthly_mood, emp_performance, on='month')
+
+# Aggregate a department's weekly mood and monthly KPI for the team chart
+# Cached per department and data version; dept_ids is passed in unhashed
+@st.cache_data(show_spinner=False)
+def build_team_mood_perf_data(_check_ins, _performance, _dept_ids, dept, data_version):
+    dept_check_ins = _check_ins.loc[_dept_ids]
+    dept_performance = _performance.loc[_dept_ids]
+    
+    # Group by week
+    weekly_mood = dept_check_ins.groupby('iso_week')[['stress', 'energy', 'motivation', 'work_enjoyment']].mean().reset_index()
+    weekly_performance = dept_performance.groupby('month')[['kpi']].mean().reset_index()
+    return weekly_mood, weekly_performance
+
 # Dashboard Home View
 def show_dashboard(employee_id=None, is_manager=False):
+    import plotly.graph_objects as go
+    
     metrics = calculate_metrics(employee_id)
     
     st.title("Employee Wellness Dashboard")
@@ -187,37 +289,26 @@ def show_dashboard(employee_id=None, is_manager=False):
     with action_cols[0]:
         with st.container(border=True):
             st.write("📝 Check-in Today")
-            if st.button("Complete Daily Check-In"):
-                st.session_state.current_page = "check_in"
-                st.rerun()
+            st.button("Complete Daily Check-In", on_click=go_to_page, args=("check_in",))
     with action_cols[1]:
         with st.container(border=True):
             st.write("🤖 AI Suggests Break")
-            if st.button("View Suggestions"):
-                st.session_state.current_page = "ai_insights"
-                st.rerun()
+            st.button("View Suggestions", on_click=go_to_page, args=("ai_insights",))
     with action_cols[2]:
         with st.container(border=True):
             st.write("💰 Bonus Potential View")
-            if st.button("View Projection"):
-                st.session_state.current_page = "compensation"
-                st.rerun()
+            st.button("View Projection", on_click=go_to_page, args=("compensation",))
     
     # Mood-Performance Correlation Graph
     st.subheader("Mood-Performance Correlation")
     
     if employee_id:
         # Individual view with error handling
+        emp_check_ins = check_ins_df.loc[employee_id:employee_id]
         try:
-            emp_check_ins = check_ins_df[check_ins_df['employee_id'] == employee_id].copy()
-            emp_performance = performance_df[performance_df['employee_id'] == employee_id].copy()
+            merged_data = build_mood_perf_data(check_ins_df, performance_df, employee_id, data_version)
             
-            if not emp_check_ins.empty and not emp_performance.empty:
-                # Convert date to month
-                emp_check_ins['month'] = pd.to_datetime(emp_check_ins['date']).dt.month
-                monthly_mood = emp_check_ins.groupby('month')[['stress', 'energy', 'motivation', 'work_enjoyment']].mean().reset_index()
-                merged_data = pd.merge(monthly_mood, emp_performance, on='month')
-                
+            if merged_data is not None:
                 fig = go.Figure()
                 
                 # Add KPI line
@@ -239,10 +330,11 @@ def show_dashboard(employee_id=None, is_manager=False):
                 
                 # Only add annotation if we have data
                 if not merged_data.empty:
-                    max_kpi_month = merged_data.loc[merged_data['kpi'].idxmax(), 'month']
+                    kpi_arr = merged_data['kpi'].to_numpy()
+                    peak = kpi_arr.argmax()
                     fig.add_annotation(
-                        x=max_kpi_month,
-                        y=merged_data.loc[merged_data['month'] == max_kpi_month, 'kpi'].values[0],
+                        x=merged_data['month'].iat[peak],
+                        y=kpi_arr[peak],
                         text="Peak performance",
                         showarrow=True,
                         arrowhead=1
@@ -270,24 +362,17 @@ def show_dashboard(employee_id=None, is_manager=False):
     else:
         # Team view (unchanged)
         dept = st.selectbox("Select Department", employees_df['department'].unique())
-        dept_metrics = calculate_metrics(department=dept)
-        
-        dept_check_ins = check_ins_df[check_ins_df['employee_id'].isin(
-            employees_df[employees_df['department'] == dept]['id'].tolist()
-        )]
-        dept_performance = performance_df[performance_df['employee_id'].isin(
-            employees_df[employees_df['department'] == dept]['id'].tolist()
-        )]
+        dept_members = employees_df[employees_df['department'] == dept]
+        dept_ids = dept_members['id'].to_numpy()
         
-        # Group by week
-        dept_check_ins['week'] = pd.to_datetime(dept_check_ins['date']).dt.isocalendar().week
-        weekly_mood = dept_check_ins.groupby('week')[['stress', 'energy', 'motivation', 'work_enjoyment']].mean().reset_index()
-        weekly_performance = dept_performance.groupby('month')[['kpi']].mean().reset_index()
+        weekly_mood, weekly_performance = build_team_mood_perf_data(
+            check_ins_df, performance_df, dept_ids, dept, data_version
+        )
         
         fig = go.Figure()
         
         fig.add_trace(go.Scatter(
-            x=weekly_mood['week'],
+            x=weekly_mood['iso_week'],
             y=weekly_mood['work_enjoyment']*10,
             name="Team Mood (Work Enjoyment)",
             line=dict(color='green', width=2)
@@ -314,37 +399,31 @@ def show_dashboard(employee_id=None, is_manager=False):
         st.subheader("Your Recent Check-ins")
         recent_check_ins = emp_check_ins.sort_values('date', ascending=False).head(5)
         st.dataframe(recent_check_ins[['date', 'stress', 'energy', 'motivation', 'work_enjoyment', 'notes']], 
+                    column_config={"date": st.column_config.DateColumn("date")},
                     hide_index=True)
     elif is_manager:
         st.subheader("Team Burnout Risk Overview")
-        team_status = []
-        for emp_id in employees_df[employees_df['department'] == dept]['id']:
-            emp_metrics = calculate_metrics(emp_id)
-            emp_name = employees_df[employees_df['id'] == emp_id]['name'].values[0]
-            team_status.append({
-                'Employee': emp_name,
-                'Burnout Risk': emp_metrics['burnout_risk'],
-                'Last Check-in': emp_metrics['latest_date'],
-                'Performance': emp_metrics['avg_kpi']
-            })
-        
-        team_df = pd.DataFrame(team_status)
-        
-        # Color coding
-        def color_burnout(val):
-            if val == "High":
-                color = 'red'
-            elif val == "Moderate":
-                color = 'orange'
-            else:
-                color = 'green'
-            return f'background-color: {color}'
+        team_metrics = lookup_metrics(compute_all_metrics(check_ins_df, performance_df, data_version), dept_ids)
+        
+        team_df = pd.DataFrame({
+            'Employee': dept_members['name'].to_numpy(),
+            'Risk': burnout_icons(team_metrics['burnout_risk'].array),
+            'Burnout Risk': team_metrics['burnout_risk'].array,
+            'Last Check-in': team_metrics['latest_date'].to_numpy(),
+            'Performance': team_metrics['avg_kpi'].to_numpy()
+        })
         
-        st.dataframe(team_df.style.applymap(color_burnout, subset=['Burnout Risk']), 
+        st.dataframe(team_df,
+                    column_config={
+                        "Risk": st.column_config.TextColumn("Risk", width="small"),
+                        "Last Check-in": st.column_config.DateColumn("Last Check-in")
+                    },
                     hide_index=True, use_container_width=True)
 
 # Daily/Weekly Check-In Page
 def show_check_in():
+    import plotly.graph_objects as go
+    
     st.title("Daily Check-In")
     
     with st.form("check_in_form"):
@@ -373,7 +452,7 @@ def show_check_in():
     # Show historical data
     if 'current_employee_id' in st.session_state:
         emp_id = st.session_state.current_employee_id
-        emp_check_ins = check_ins_df[check_ins_df['employee_id'] == emp_id].sort_values('date', ascending=False).head(7)
+        emp_check_ins = check_ins_df.loc[emp_id:emp_id].sort_values('date', ascending=False).head(7)
         
         st.subheader("Your Recent Check-ins")
         
@@ -478,6 +557,9 @@ def show_ai_insights():
 
 # Smart Compensation Preview
 def show_compensation():
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
     st.title("Smart Compensation Preview")
     
     # Generate some dummy compensation data
@@ -625,6 +707,8 @@ def show_engagement_toolkit():
 
 # Manager View
 def show_manager_view():
+    import plotly.express as px
+    
     st.title("Team Management Dashboard")
     
     # Department selector
@@ -633,38 +717,16 @@ def show_manager_view():
     # Team overview
     st.subheader("Team Overview")
     
-    # Calculate metrics for each team member
-    team_members = employees_df[employees_df['department'] == dept]
-    team_data = []
-    
-    for _, emp in team_members.iterrows():
-        metrics = calculate_metrics(emp['id'])
-        team_data.append({
-            'Name': emp['name'],
-            'Role': emp['role'],
-            'Burnout Risk': metrics['burnout_risk'],
-            'Performance': metrics['avg_kpi'],
-            'Last Check-in': metrics['latest_date'],
-            'ID': emp['id']
-        })
-    
-    team_df = pd.DataFrame(team_data)
-    
-    # Color coding function
-    def color_burnout(val):
-        if val == "High":
-            color = 'red'
-        elif val == "Moderate":
-            color = 'orange'
-        else:
-            color = 'green'
-        return f'background-color: {color}'
+    # Team summary, cached per department
+    team_df = build_team_df(employees_df, check_ins_df, performance_df, dept, data_version)
     
     # Display team status
     st.dataframe(
-        team_df.style.applymap(color_burnout, subset=['Burnout Risk']),
+        team_df,
         column_config={
             "ID": None,
+            "Risk": st.column_config.TextColumn("Risk", width="small"),
+            "Last Check-in": st.column_config.DateColumn("Last Check-in"),
             "Performance": st.column_config.ProgressColumn(
                 "Performance",
                 help="Employee's performance KPI",
@@ -777,7 +839,9 @@ def show_login():
                     # Create initial check-in data
                     new_check_in = {
                         'employee_id': new_id,
-                        'date': datetime.now().date(),
+                        'date': pd.Timestamp.today().normalize(),
+                        'month': datetime.now().month,
+                        'iso_week': datetime.now().isocalendar().week,
                         'stress': 5,
                         'energy': 5,
                         'motivation': 5,
@@ -786,8 +850,8 @@ def show_login():
                     }
                     check_ins_df = pd.concat([
                         check_ins_df,
-                        pd.DataFrame([new_check_in])
-                    ], ignore_index=True)
+                        pd.DataFrame([new_check_in]).set_index('employee_id')
+                    ])
                     
                     # Create performance data
                     new_performance = {
@@ -800,8 +864,8 @@ def show_login():
                     }
                     performance_df = pd.concat([
                         performance_df,
-                        pd.DataFrame([new_performance])
-                    ], ignore_index=True)
+                        pd.DataFrame([new_performance]).set_index('employee_id')
+                    ])
                     
                     # Set session state
                     st.session_state.logged_in = True
@@ -813,6 +877,15 @@ def show_login():
             else:
                 st.error("Invalid credentials. Use any email ending with @company.com and password 'password'")
 
+# Navigation callbacks run before the next script run, so the target page
+# renders in that same pass instead of needing an extra st.rerun()
+def go_to_page(page):
+    st.session_state.current_page = page
+
+def logout():
+    for key in list(st.session_state.keys()):
+        del st.session_state[key]
+
 # Main app logic
 def main():
     if 'current_page' not in st.session_state:
@@ -831,36 +904,18 @@ def main():
         
         st.divider()
         
-        if st.button("🏠 Dashboard"):
-            st.session_state.current_page = "dashboard"
-            st.rerun()
+        st.button("🏠 Dashboard", on_click=go_to_page, args=("dashboard",))
+        st.button("📝 Daily Check-In", on_click=go_to_page, args=("check_in",))
+        st.button("🤖 AI Insights", on_click=go_to_page, args=("ai_insights",))
+        st.button("💰 Compensation", on_click=go_to_page, args=("compensation",))
+        st.button("🧰 Engagement Toolkit", on_click=go_to_page, args=("engagement",))
         
-        if st.button("📝 Daily Check-In"):
-            st.session_state.current_page = "check_in"
-            st.rerun()
-        
-        if st.button("🤖 AI Insights"):
-            st.session_state.current_page = "ai_insights"
-            st.rerun()
-        
-        if st.button("💰 Compensation"):
-            st.session_state.current_page = "compensation"
-            st.rerun()
-        
-        if st.button("🧰 Engagement Toolkit"):
-            st.session_state.current_page = "engagement"
-            st.rerun()
-        
-        if st.session_state.is_manager and st.button("👔 Manager View"):
-            st.session_state.current_page = "manager"
-            st.rerun()
+        if st.session_state.is_manager:
+            st.button("👔 Manager View", on_click=go_to_page, args=("manager",))
         
         st.divider()
         
-        if st.button("🚪 Logout"):
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
-            st.rerun()
+        st.button("🚪 Logout", on_click=logout)
     
     # Page routing
     if st.session_state.current_page == "dashboard":